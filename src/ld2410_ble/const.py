@@ -1,3 +1,5 @@
+import re
+
 CHARACTERISTIC_NOTIFY = "0000fff1-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_WRITE = "0000fff2-0000-1000-8000-00805f9b34fb"
 
@@ -17,6 +19,14 @@ MAX_GATES = 9
 MAX_SENSE_VAL = 100
 MIN_SENSE_VAL = 0
 
+# Smallest complete frame: header + length + basic mode data + footer
+MIN_FRAME_LEN = 23
+# Bounds for the length field: basic mode data is 13 bytes (10 data
+# bytes plus tail and check), engineering mode data is 33 bytes; leave
+# headroom above that for additional information
+MIN_FRAME_PAYLOAD = 13
+MAX_FRAME_PAYLOAD = 64
+
 frame_start = b"\xf4\xf3\xf2\xf1"
 frame_length = b"(?P<length>..)"
 frame_engineering_mode = b"(?P<engineering>\x01|\x02)"
@@ -32,33 +42,23 @@ frame_tail = b"\x55"
 frame_check = b"\x00"
 frame_end = b"\xf8\xf7\xf6\xf5"
 
-frame_maximum_motion_gates = b"(?P<maximum_motion_gates>.)"
-frame_maximum_static_gates = b"(?P<maximum_static_gates>.)"
-frame_motion_energy_gates = b"(?P<motion_energy_gates>.{9})"
-frame_static_energy_gates = b"(?P<static_energy_gates>.{9})"
-frame_additional_information = b"(?P<additional_information>.*)"
-
-frame_regex = (
-    frame_start
-    + frame_length
-    + frame_engineering_mode
-    + frame_head
-    + frame_target_state
-    + frame_moving_target_distance
-    + frame_moving_target_energy
-    + frame_static_target_distance
-    + frame_static_target_energy
-    + frame_detection_distance
-    + frame_engineering_data
-    + frame_tail
-    + frame_check
-    + frame_end
+frame_regex = b"".join(
+    (
+        frame_start,
+        frame_length,
+        frame_engineering_mode,
+        frame_head,
+        frame_target_state,
+        frame_moving_target_distance,
+        frame_moving_target_energy,
+        frame_static_target_distance,
+        frame_static_target_energy,
+        frame_detection_distance,
+        frame_engineering_data,
+        frame_tail,
+        frame_check,
+        frame_end,
+    )
 )
 
-engineering_frame_regex = (
-    frame_maximum_motion_gates
-    + frame_maximum_static_gates
-    + frame_motion_energy_gates
-    + frame_static_energy_gates
-    + frame_additional_information
-)
+FRAME_RE = re.compile(frame_regex, re.DOTALL)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import re
+import struct
 import sys
 from collections.abc import Callable
 from typing import Any, TypeVar
@@ -28,10 +28,21 @@ from .const import (
     CMD_DISABLE_CONFIG,
     CMD_ENABLE_CONFIG,
     CMD_ENABLE_ENGINEERING_MODE,
+    CMD_POSTAMBLE,
+    CMD_PREAMBLE,
+    MAX_FRAME_PAYLOAD,
+    MAX_GATES,
+    MAX_SENSE_VAL,
+    MIN_FRAME_LEN,
+    MIN_FRAME_PAYLOAD,
+    MIN_SENSE_VAL,
     MOVING_TARGET,
     STATIC_TARGET,
-    engineering_frame_regex,
-    frame_regex,
+    frame_check,
+    frame_end,
+    frame_head,
+    frame_start,
+    frame_tail,
 )
 from .exceptions import CharacteristicMissingError
 from .models import LD2410BLEState
@@ -49,6 +60,15 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_ATTEMPTS = sys.maxsize
 
+# Intra-frame data length, little endian, directly after the frame header
+_FRAME_LENGTH = struct.Struct("<H")
+# target_state through detection_distance, directly after the 0xAA data head
+_TARGET_DATA = struct.Struct("<BHBHBH")
+# Engineering mode block: maximum gates plus 9+9 per-gate energies
+_ENGINEERING_DATA = struct.Struct("<BB9s9s")
+# Frame tail, check byte and footer, validated as a single comparison
+_FRAME_TRAILER = frame_tail + frame_check + frame_end
+
 
 class LD2410BLE:
     def __init__(
@@ -74,7 +94,13 @@ class LD2410BLE:
         self.loop = asyncio.get_running_loop()
         self._callbacks: list[Callable[[LD2410BLEState], None]] = []
         self._disconnected_callbacks: list[Callable[[], None]] = []
-        self._buf = b""
+        self._buf = bytearray()
+        self._handshake_commands = (
+            CMD_BT_PASS_PRE + password + CMD_BT_PASS_POST,
+            CMD_ENABLE_CONFIG,
+            CMD_ENABLE_ENGINEERING_MODE,
+            CMD_DISABLE_CONFIG,
+        )
         self._set_max_motion_sense(max_motion_sense)
         self._set_max_static_sense(max_static_sense)
         #self._set_interval_timer(interval_timer)
@@ -136,143 +162,21 @@ class LD2410BLE:
         """Return the state."""
         return self._state
 
-    @property
-    def is_moving(self) -> bool:
-        return self._state.is_moving
-
-    @property
-    def is_static(self) -> bool:
-        return self._state.is_static
-
-    @property
-    def moving_target_distance(self) -> int:
-        return self._state.moving_target_distance
-
-    @property
-    def moving_target_energy(self) -> int:
-        return self._state.moving_target_energy
-
-    @property
-    def static_target_distance(self) -> int:
-        return self._state.static_target_distance
-
-    @property
-    def static_target_energy(self) -> int:
-        return self._state.static_target_energy
-
-    @property
-    def detection_distance(self) -> int:
-        return self._state.detection_distance
-
-    @property
-    def max_motion_gates(self) -> int:
-        assert self._state.max_motion_gates is not None  # nosec
-        return self._state.max_motion_gates
-
-    @property
-    def max_static_gates(self) -> int:
-        assert self._state.max_static_gates is not None  # nosec
-        return self._state.max_static_gates
-
-    @property
-    def motion_energy_gates(self) -> list[int]:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates
-
-    @property
-    def motion_energy_gate_0(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[0]
-
-    @property
-    def motion_energy_gate_1(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[1]
-
-    @property
-    def motion_energy_gate_2(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[2]
-
-    @property
-    def motion_energy_gate_3(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[3]
-
-    @property
-    def motion_energy_gate_4(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[4]
-
-    @property
-    def motion_energy_gate_5(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[5]
-
-    @property
-    def motion_energy_gate_6(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[6]
-
-    @property
-    def motion_energy_gate_7(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[7]
-
-    @property
-    def motion_energy_gate_8(self) -> int:
-        assert self._state.motion_energy_gates is not None  # nosec
-        return self._state.motion_energy_gates[8]
-
-    @property
-    def static_energy_gates(self) -> list[int]:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates
-
-    @property
-    def static_energy_gate_0(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[0]
-
-    @property
-    def static_energy_gate_1(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[1]
-
-    @property
-    def static_energy_gate_2(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[2]
-
-    @property
-    def static_energy_gate_3(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[3]
-
-    @property
-    def static_energy_gate_4(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[4]
-
-    @property
-    def static_energy_gate_5(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[5]
-
-    @property
-    def static_energy_gate_6(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[6]
-
-    @property
-    def static_energy_gate_7(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[7]
-
-    @property
-    def static_energy_gate_8(self) -> int:
-        assert self._state.static_energy_gates is not None  # nosec
-        return self._state.static_energy_gates[8]
+    def __getattr__(self, name: str) -> Any:
+        """Delegate state accessors to the current LD2410BLEState."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name.startswith(("motion_energy_gate_", "static_energy_gate_")):
+            gates = (
+                self._state.motion_energy_gates
+                if name.startswith("m")
+                else self._state.static_energy_gates
+            )
+            suffix = name[len("motion_energy_gate_") :]  # noqa: E203
+            if gates is None or len(suffix) != 1 or not "0" <= suffix <= "8":
+                raise AttributeError(name)
+            return gates[int(suffix)]
+        return getattr(self._state, name)
 
     async def stop(self) -> None:
         """Stop the LD2410BLE."""
@@ -313,16 +217,11 @@ class LD2410BLE:
 
     async def initialise(self) -> None:
         _LOGGER.debug("%s: Sending configuration commands", self.name)
-        await self._send_command(CMD_BT_PASS_PRE + self._password + CMD_BT_PASS_POST)
-        await asyncio.sleep(0.1)
-        await self._send_command(CMD_ENABLE_CONFIG)
-        await asyncio.sleep(0.1)
-        await self._send_command(CMD_ENABLE_ENGINEERING_MODE)
-        await asyncio.sleep(0.1)
-        await self._send_command(CMD_DISABLE_CONFIG)
+        # Pipeline the handshake as a single locked write sequence instead
+        # of four separate sends serialized by 100ms sleeps
+        await self._send_command(self._handshake_commands)
         await asyncio.sleep(0.1)
         await self._send_max_sense_cmd()
-        await asyncio.sleep(0.1)
 
         _LOGGER.debug("%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi)
         if self._client is not None:
@@ -370,56 +269,12 @@ class LD2410BLE:
             _LOGGER.debug("reconnecting again")
             asyncio.create_task(self._reconnect())
 
-    def intify(self, state: bytes) -> int:
-        return int.from_bytes(state, byteorder="little")
-
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
         _LOGGER.debug("%s: Notification received: %s", self.name, data.hex())
 
-        self._buf += data
-        msg = re.search(frame_regex, self._buf)
-        if msg:
-            self._buf = self._buf[msg.end() :]  # noqa: E203
-            target_state = msg.group("target_state")
-            engineering_data = msg.group("engineering_data")
-
-            target_state_int = self.intify(target_state)
-            is_moving = bool(target_state_int & MOVING_TARGET)
-            is_static = bool(target_state_int & STATIC_TARGET)
-            moving_target_distance = self.intify(msg.group("moving_target_distance"))
-            moving_target_energy = self.intify(msg.group("moving_target_energy"))
-            static_target_distance = self.intify(msg.group("static_target_distance"))
-            static_target_energy = self.intify(msg.group("static_target_energy"))
-            detection_distance = self.intify(msg.group("detection_distance"))
-
-            max_motion_gates = None
-            max_static_gates = None
-            motion_energy_gates = None
-            static_energy_gates = None
-            if engineering_data:
-                em = re.match(engineering_frame_regex, engineering_data)
-                if em:
-                    max_motion_gates = self.intify(em.group("maximum_motion_gates"))
-                    max_static_gates = self.intify(em.group("maximum_static_gates"))
-                    motion_energy_gates = [x for x in em.group("motion_energy_gates")]
-                    static_energy_gates = [x for x in em.group("static_energy_gates")]
-
-            self._state = LD2410BLEState(
-                is_moving=is_moving,
-                is_static=is_static,
-                moving_target_distance=moving_target_distance,
-                moving_target_energy=moving_target_energy,
-                static_target_distance=static_target_distance,
-                static_target_energy=static_target_energy,
-                detection_distance=detection_distance,
-                max_motion_gates=max_motion_gates,
-                max_static_gates=max_static_gates,
-                motion_energy_gates=motion_energy_gates,
-                static_energy_gates=static_energy_gates,
-            )
-
-            self._fire_callbacks()
+        self._buf.extend(data)
+        self._parse_buffer()
 
         _LOGGER.debug(
             "%s: Notification received; RSSI: %s: %s %s",
@@ -429,6 +284,79 @@ class LD2410BLE:
             self._state,
         )
 
+    def _parse_buffer(self) -> None:
+        """Decode any complete frames from the accumulated buffer."""
+        while len(self._buf) >= MIN_FRAME_LEN:
+            start = self._buf.find(frame_start)
+            if start == -1 or len(self._buf) < start + 6:
+                return
+            (length,) = _FRAME_LENGTH.unpack_from(self._buf, start + 4)
+            if length < MIN_FRAME_PAYLOAD or length > MAX_FRAME_PAYLOAD:
+                # Implausible length means a spurious header; drop it and
+                # resync instead of waiting for that many bytes to arrive
+                # or unpacking past the end of an undersized frame
+                del self._buf[: start + 4]
+                continue
+            end = start + 6 + length
+            if len(self._buf) < end + 4:
+                return
+            if (
+                self._buf[start + 6] not in (1, 2)  # engineering mode byte
+                or self._buf[start + 7 : start + 8] != frame_head
+                or self._buf[start + 8] & 0xFC  # target_state is a 2-bit value
+                or self._buf[end - 2 : end + 4] != _FRAME_TRAILER
+            ):
+                # Corrupt or misaligned frame, drop the header and resync
+                del self._buf[: start + 4]
+                continue
+            new_state = self._parse_frame(start, end)
+            del self._buf[: end + 4]
+            if new_state != self._state:
+                self._state = new_state
+                self._fire_callbacks()
+
+    def _parse_frame(self, start: int, end: int) -> LD2410BLEState:
+        """Unpack one validated frame into a new state."""
+        (
+            target_state_int,
+            moving_target_distance,
+            moving_target_energy,
+            static_target_distance,
+            static_target_energy,
+            detection_distance,
+        ) = _TARGET_DATA.unpack_from(self._buf, start + 8)
+        is_moving = bool(target_state_int & MOVING_TARGET)
+        is_static = bool(target_state_int & STATIC_TARGET)
+
+        max_motion_gates = None
+        max_static_gates = None
+        motion_energy_gates = None
+        static_energy_gates = None
+        if (
+            self._buf[start + 6] == 0x01
+            and end - 2 - (start + 17) >= _ENGINEERING_DATA.size
+        ):
+            (
+                max_motion_gates,
+                max_static_gates,
+                motion_energy_gates,
+                static_energy_gates,
+            ) = _ENGINEERING_DATA.unpack_from(self._buf, start + 17)
+
+        return LD2410BLEState(
+            is_moving=is_moving,
+            is_static=is_static,
+            moving_target_distance=moving_target_distance,
+            moving_target_energy=moving_target_energy,
+            static_target_distance=static_target_distance,
+            static_target_energy=static_target_energy,
+            detection_distance=detection_distance,
+            max_motion_gates=max_motion_gates,
+            max_static_gates=max_static_gates,
+            motion_energy_gates=motion_energy_gates,
+            static_energy_gates=static_energy_gates,
+        )
+
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
         self._fire_disconnected_callbacks()
@@ -467,7 +395,7 @@ class LD2410BLE:
                 await client.disconnect()
 
     @retry_bluetooth_connection_error(DEFAULT_ATTEMPTS)
-    async def _send_command_locked(self, commands: list[bytes]) -> None:
+    async def _send_command_locked(self, commands: tuple[bytes, ...]) -> None:
         """Send command to device and read response."""
         try:
             await self._execute_command_locked(commands)
@@ -491,45 +419,48 @@ class LD2410BLE:
             await self._execute_disconnect()
             raise
 
-    async def _send_max_sense_cmd(self) -> None
+    async def _send_max_sense_cmd(self) -> None:
         """Send the command to set the max sensor values for all motion and static gates"""
+        if self._max_motion_sense is None or self._max_static_sense is None:
+            return
+
         await self._send_command(CMD_ENABLE_CONFIG)
         await asyncio.sleep(0.01)
         sense_values = zip(self._max_motion_sense, self._max_static_sense)
 
         for gate, sense_val in enumerate(sense_values):
-            self._send_command(CMD_PREAMBLE)
-            cmd = b"\x14\x00\x64\x00\x00\x00" # Preamble
-            cmd += gate.to_bytes(1)           # Gate value
-            cmd += b"\x00\x00\x00"            # Spacer
-            cmd += b"\x01\x00"                # Motion sense command
-            cmd += sense_val[0].to_bytes(1)   # Motion sense value
-	    cmd += b"\x00\x00"                # Spacer
-            cmd += b"\x00\x02\x00"            # Static sense command
-	    cmd += sense_val[1].to_bytes(1)   # Static sense value
-	    cmd += b"\x00\x00\x00"            # Spacer
-            self._send_command(CMD_POSTAMBLE)
+            cmd = b"\x14\x00\x64\x00\x00\x00"          # Preamble
+            cmd += gate.to_bytes(1, "little")          # Gate value
+            cmd += b"\x00\x00\x00"                     # Spacer
+            cmd += b"\x01\x00"                         # Motion sense command
+            cmd += sense_val[0].to_bytes(1, "little")  # Motion sense value
+            cmd += b"\x00\x00"                         # Spacer
+            cmd += b"\x00\x02\x00"                     # Static sense command
+            cmd += sense_val[1].to_bytes(1, "little")  # Static sense value
+            cmd += b"\x00\x00\x00"                     # Spacer
+            await self._send_command(CMD_PREAMBLE + cmd + CMD_POSTAMBLE)
 
         await self._send_command(CMD_DISABLE_CONFIG)
 
     async def _send_command(
-        self, commands: list[bytes] | bytes, retry: int | None = None
+        self, commands: tuple[bytes, ...] | bytes, retry: int | None = None
     ) -> None:
         """Send command to device and read response."""
         await self._ensure_connected()
-        if not isinstance(commands, list):
-            commands = [commands]
+        if isinstance(commands, (bytes, bytearray)):
+            commands = (commands,)
         await self._send_command_while_connected(commands, retry)
 
     async def _send_command_while_connected(
-        self, commands: list[bytes], retry: int | None = None
+        self, commands: tuple[bytes, ...], retry: int | None = None
     ) -> None:
         """Send command to device and read response."""
-        _LOGGER.debug(
-            "%s: Sending commands %s",
-            self.name,
-            [command.hex() for command in commands],
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Sending commands %s",
+                self.name,
+                [command.hex() for command in commands],
+            )
         if self._operation_lock.locked():
             _LOGGER.debug(
                 "%s: Operation already in progress, waiting for it to complete; RSSI: %s",
@@ -563,7 +494,7 @@ class LD2410BLE:
 
         raise RuntimeError("Unreachable")
 
-    async def _execute_command_locked(self, commands: list[bytes]) -> None:
+    async def _execute_command_locked(self, commands: tuple[bytes, ...]) -> None:
         """Execute command and read response."""
         assert self._client is not None  # nosec
         for command in commands:
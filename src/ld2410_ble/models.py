@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @dataclass(frozen=True)
@@ -15,9 +15,5 @@ class LD2410BLEState:
     detection_distance: int = 0
     max_motion_gates: int | None = 8
     max_static_gates: int | None = 8
-    motion_energy_gates: list[int] | None = field(
-        default_factory=lambda: [0, 0, 0, 0, 0, 0, 0, 0, 0]
-    )
-    static_energy_gates: list[int] | None = field(
-        default_factory=lambda: [0, 0, 0, 0, 0, 0, 0, 0, 0]
-    )
+    motion_energy_gates: bytes | None = bytes(9)
+    static_energy_gates: bytes | None = bytes(9)